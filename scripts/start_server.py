@@ -11,19 +11,24 @@ import os
 import sys
 import logging
 from pathlib import Path
-from typing import List
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from typing import Final, List, Optional
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _env import ensure_loaded, env_flag
+
+# Load environment variables from .env file
+ensure_loaded()
+
+# Environment flags are read once at import; changes require a restart.
+DEBUG: Final[bool] = env_flag("DEBUG")
+AWS_REGION: Final[Optional[str]] = os.getenv("AWS_DEFAULT_REGION")
+
 
 def setup_logging() -> None:
     """Setup logging configuration."""
-    log_level = logging.DEBUG if os.getenv("DEBUG", "false").lower() in ("true", "1", "yes") else logging.INFO
+    log_level = logging.DEBUG if DEBUG else logging.INFO
     logging.basicConfig(
         level=log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -45,7 +50,7 @@ def check_environment() -> bool:
             missing_vars.append(var)
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: %s", ", ".join(missing_vars))
         print("Error: Missing required environment variables:")
         for var in missing_vars:
             print(f"  - {var}")
@@ -65,15 +70,14 @@ def show_configuration() -> None:
     print("=" * 50)
     
     # AWS Region
-    aws_region = os.getenv('AWS_DEFAULT_REGION', 'Not specified (boto3 will use its default)')
+    aws_region = AWS_REGION or 'Not specified (boto3 will use its default)'
     print(f"AWS Region: {aws_region}")
-    logger.info(f"AWS Region: {aws_region}")
+    logger.info("AWS Region: %s", aws_region)
     
     # Debug mode
-    debug_mode = os.getenv('DEBUG', 'false').lower() in ('true', '1', 'yes')
-    debug_str = 'Enabled' if debug_mode else 'Disabled'
+    debug_str = 'Enabled' if DEBUG else 'Disabled'
     print(f"Debug mode: {debug_str}")
-    logger.info(f"Debug mode: {debug_str}")
+    logger.info("Debug mode: %s", debug_str)
     
     print("=" * 50)
     print()
@@ -108,7 +112,7 @@ def main() -> None:
         server_main()
         
     except ImportError as e:
-        logger.error(f"Import error: {e}", exc_info=True)
+        logger.error("Import error: %s", e, exc_info=True)
         print(f"Error: Failed to import the server module: {e}")
         print("Please ensure all dependencies are installed by running: uv sync")
         sys.exit(1)
@@ -118,7 +122,7 @@ def main() -> None:
         print("\nServer startup cancelled.")
         
     except Exception as e:
-        logger.error(f"An unexpected error occurred during startup: {e}", exc_info=True)
+        logger.error("An unexpected error occurred during startup: %s", e, exc_info=True)
         print(f"Error: An unexpected error occurred: {e}")
         sys.exit(1)
 
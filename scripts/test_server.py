@@ -12,14 +12,24 @@ import sys
 import json
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from typing import Optional
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from _env import ensure_loaded
+
+# Load environment variables from .env file
+ensure_loaded()
+
+# Import the server module once; test_import reports any failure
+try:
+    import s3_mcp as _mcp
+    _import_error: Optional[Exception] = None
+except Exception as e:
+    _mcp = None
+    _import_error = e
+
 
 def setup_logging() -> None:
     """Setup logging configuration."""
@@ -35,18 +45,16 @@ def test_import() -> bool:
     Returns:
         bool: True if import successful
     """
-    try:
-        print(" Testing module import...")
-        from s3_mcp import get_s3_client
-        print("✅ Module import successful")
-        return True
-    except ImportError as e:
-        print(f"❌ Import failed: {e}")
+    print(" Testing module import...")
+    if isinstance(_import_error, ImportError):
+        print(f"❌ Import failed: {_import_error}")
         print("Please install dependencies: uv sync")
         return False
-    except Exception as e:
-        print(f"❌ Unexpected import error: {e}")
+    if _import_error is not None:
+        print(f"❌ Unexpected import error: {_import_error}")
         return False
+    print("✅ Module import successful")
+    return True
 
 
 def test_environment() -> bool:
@@ -83,10 +91,9 @@ def test_connection() -> bool:
     print("\n Testing AWS S3 connection...")
     
     try:
-        from s3_mcp import get_s3_client
-        
-        # Test getting client. The function itself performs a check.
-        client = get_s3_client()
+        # The client is created lazily, so issue a request to check credentials.
+        client = _mcp.get_s3_client()
+        client.list_buckets()
         
         print(f"✅ Connected to AWS S3 successfully")
         return True
@@ -105,11 +112,9 @@ def test_basic_operations() -> bool:
     print("\n Testing basic operations...")
     
     try:
-        from s3_mcp import _list_buckets_logic
-        
         # Test bucket listing
         print("  - Testing bucket retrieval...")
-        buckets_data = _list_buckets_logic()
+        buckets_data = _mcp._list_buckets_logic()
 
         if 'Buckets' in buckets_data:
             print(f"    ✅ Retrieved {len(buckets_data['Buckets'])} bucket(s)")
@@ -0,0 +1,36 @@
+"""
+Environment loading shared by the S3 MCP server and its helper scripts.
+"""
+
+import functools
+import os
+
+from dotenv import find_dotenv, load_dotenv
+
+# Set once the .env file has been loaded; inherited by child processes
+_LOADED_MARKER = "S3_MCP_ENV_LOADED"
+
+
+@functools.cache
+def ensure_loaded() -> None:
+    """Load environment variables from the .env file once per process tree.
+
+    Variables already present in the environment take precedence over
+    values from the .env file.
+    """
+    if _LOADED_MARKER in os.environ:
+        return
+    load_dotenv(find_dotenv(), override=False)
+    os.environ[_LOADED_MARKER] = "1"
+
+
+def env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment.
+
+    Args:
+        name (str): Name of the environment variable
+
+    Returns:
+        bool: True if the variable is set to "true", "1" or "yes"
+    """
+    return os.getenv(name, "").lower() in ("true", "1", "yes")
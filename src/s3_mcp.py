@@ -6,37 +6,153 @@ the Model Context Protocol (MCP), enabling AI assistants and other tools to
 interact with AWS S3.
 """
 
-import json
+import asyncio
+import base64
+import functools
+import io
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, Iterable, Iterator, List, Optional, Tuple, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from botocore.client import BaseClient
-from botocore.exceptions import NoCredentialsError
-from dotenv import load_dotenv
-from fastmcp import FastMCP
+from botocore.compat import HAS_CRT
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from botocore.response import StreamingBody
+from cachetools import TTLCache
+import orjson
+from s3transfer.manager import TransferManager
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+try:
+    import msgpack
+except ImportError:  # Optional, installed with the "msgpack" extra
+    msgpack = None
+
+try:
+    from ._env import ensure_loaded, env_flag
+except ImportError:  # Executed as a script with src/ on sys.path
+    from _env import ensure_loaded, env_flag
 
 # Load environment variables from .env file
-load_dotenv()
+ensure_loaded()
+
+# Environment flags are read once at import; changes require a restart.
+DEBUG: Final[bool] = env_flag("DEBUG")
+AWS_REGION: Final[Optional[str]] = os.getenv("AWS_DEFAULT_REGION")
+USE_CRT: Final[bool] = env_flag("S3_MCP_USE_CRT")
+PRETTY: Final[bool] = env_flag("PRETTY")
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO if os.getenv("DEBUG") else logging.WARNING,
+    level=logging.INFO if DEBUG else logging.WARNING,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP
-mcp = FastMCP("S3 MCP Server")
+# Default lifetime of cached metadata responses, in seconds
+DEFAULT_CACHE_TTL: Final[float] = 30.0
+
+
+def _read_cache_ttl() -> float:
+    """Read the metadata cache TTL from the environment.
+
+    Returns:
+        float: AWS_S3_MCP_CACHE_TTL in seconds, or the default if it is
+            unset or not a number
+    """
+    value = os.getenv("AWS_S3_MCP_CACHE_TTL")
+    if value is None:
+        return DEFAULT_CACHE_TTL
+    try:
+        return float(value)
+    except ValueError:
+        logger.error(
+            "Invalid AWS_S3_MCP_CACHE_TTL %r; using the default of %s seconds.",
+            value,
+            DEFAULT_CACHE_TTL,
+        )
+        return DEFAULT_CACHE_TTL
+
+
+CACHE_TTL: Final[float] = _read_cache_ttl()
+
+# Worker threads for concurrent S3 requests and for file transfers
+EXECUTOR_MAX_WORKERS: Final[int] = 16
+TRANSFER_MAX_CONCURRENCY: Final[int] = (os.cpu_count() or 1) * 2
+
+# Size of asyncio's default executor, which runs the asyncio.to_thread calls
+DEFAULT_EXECUTOR_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) + 4)
+
+# Shared boto3 session, so credentials are resolved once per process
+_SESSION: Final[boto3.session.Session] = boto3.session.Session()
+
+# Connection pool and retry settings for the S3 client. The pool is large
+# enough for every thread that uses the client (request workers, transfer
+# threads and asyncio.to_thread calls) to hold a kept-alive connection at once.
+S3_CLIENT_CONFIG: Final[Config] = Config(
+    max_pool_connections=max(
+        64,
+        EXECUTOR_MAX_WORKERS + TRANSFER_MAX_CONCURRENCY + DEFAULT_EXECUTOR_MAX_WORKERS,
+    ),
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
 
 # Global S3 client
 s3_client: Optional[BaseClient] = None
 
+# Global transfer manager used by upload_file and download_file
+transfer_manager: Optional[Any] = None
+
+# Guards creation of the S3 client and transfer manager
+_client_lock: Final[threading.RLock] = threading.RLock()
+
+# orjson options for tool responses; indentation only when PRETTY is set
+JSON_OPTIONS: Final[int] = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY else 0)
+
+# Cache for idempotent metadata requests; disabled when CACHE_TTL is 0
+_metadata_cache: Final[Optional[TTLCache]] = (
+    TTLCache(maxsize=1024, ttl=CACHE_TTL) if CACHE_TTL > 0 else None
+)
+_metadata_cache_lock: Final[threading.RLock] = threading.RLock()
+
+# Bumped by every invalidation, so fetches that raced a write are not stored
+_metadata_cache_generation: int = 0
+
+# Content types whose bodies are returned as text instead of base64
+TEXT_CONTENT_TYPES: Final[Tuple[str, ...]] = ("text/", "application/json", "application/xml")
+
+# Generic content types whose bodies are decoded as UTF-8 if they are valid
+UNTYPED_CONTENT_TYPES: Final[Tuple[str, ...]] = ("", "binary/octet-stream", "application/octet-stream")
+
+# Chunk size used when reading object bodies
+BODY_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+# Maximum number of keys accepted by a single DeleteObjects request
+DELETE_BATCH_SIZE: Final[int] = 1000
+
+# Worker pool for S3 requests that can be issued concurrently
+_executor: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="s3-mcp"
+)
+
 
 def get_s3_client() -> BaseClient:
     """Get or create the S3 boto3 client.
 
+    Credentials are only checked for presence, which needs no request to
+    S3; invalid credentials surface as errors from the first S3 request.
+    The client is created exactly once, even when tools run concurrently.
+
     Returns:
         BaseClient: S3 client
 
@@ -46,21 +162,171 @@ def get_s3_client() -> BaseClient:
     global s3_client
 
     if s3_client is None:
-        logger.info("Initializing S3 client")
-        try:
-            s3_client = boto3.client("s3")
-            s3_client.list_buckets()  # Validate credentials
-            logger.info("Successfully initialized and validated S3 client.")
-        except NoCredentialsError as e:
-            logger.error("AWS credentials not found.")
-            raise e
-        except Exception as e:
-            logger.error(f"Unexpected error initializing S3 client: {e}")
-            raise e
+        with _client_lock:
+            if s3_client is None:
+                logger.info("Initializing S3 client")
+                try:
+                    if _SESSION.get_credentials() is None:
+                        raise NoCredentialsError()
+                    s3_client = _SESSION.client("s3", config=S3_CLIENT_CONFIG)
+                    logger.info("Successfully initialized S3 client.")
+                except NoCredentialsError as e:
+                    logger.error("AWS credentials not found.")
+                    raise e
+                except (BotoCoreError, ClientError) as e:
+                    logger.error("Unexpected error initializing S3 client: %s", e, exc_info=DEBUG)
+                    raise e
 
     return s3_client
 
 
+def get_transfer_manager() -> Any:
+    """Get or create the transfer manager for file uploads and downloads.
+
+    The manager wraps the shared S3 client. When ``S3_MCP_USE_CRT`` is set
+    and awscrt is installed, boto3 is asked for the AWS CRT transfer client,
+    which runs multipart transfers in native code.
+
+    Returns:
+        Any: boto3 transfer manager
+    """
+    global transfer_manager
+
+    if transfer_manager is None:
+        with _client_lock:
+            if transfer_manager is None:
+                # Only options the CRT client accepts; threads are the default
+                config = TransferConfig(
+                    max_concurrency=TRANSFER_MAX_CONCURRENCY,
+                    multipart_threshold=8 * 1024 * 1024,
+                    multipart_chunksize=16 * 1024 * 1024,
+                    preferred_transfer_client="crt" if USE_CRT and HAS_CRT else "classic",
+                )
+                if USE_CRT and not HAS_CRT:
+                    logger.warning(
+                        "S3_MCP_USE_CRT is set but awscrt is not installed; "
+                        "install the 'crt' extra to use the CRT transfer client."
+                    )
+                transfer_manager = create_transfer_manager(get_s3_client(), config)
+                if USE_CRT and HAS_CRT and isinstance(transfer_manager, TransferManager):
+                    logger.warning(
+                        "S3_MCP_USE_CRT is set but boto3 could not create a CRT "
+                        "transfer manager; using the classic transfer client."
+                    )
+                logger.info("Using %s for file transfers", type(transfer_manager).__name__)
+
+    return transfer_manager
+
+
+def _cached(
+    key: Tuple[Any, ...],
+    fetch: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Return a cached metadata response, fetching it on a miss.
+
+    The request itself runs outside the lock, so concurrent misses do not
+    wait on each other. A response is only stored if no invalidation ran
+    while it was being fetched. Callers get a shallow copy; nested values
+    are shared with the cache and must not be modified.
+
+    Args:
+        key (Tuple[Any, ...]): Cache key; object entries start with
+            ("head_object", bucket, key)
+        fetch (Callable[[], Dict[str, Any]]): Performs the S3 request
+
+    Returns:
+        Dict[str, Any]: Cached or freshly fetched boto3 response
+    """
+    if _metadata_cache is None:
+        return fetch()
+
+    with _metadata_cache_lock:
+        response = _metadata_cache.get(key)
+        generation = _metadata_cache_generation
+    if response is None:
+        response = fetch()
+        with _metadata_cache_lock:
+            if generation == _metadata_cache_generation:
+                _metadata_cache[key] = response
+    return dict(response)
+
+
+def _invalidate_objects(bucket: str, keys: Iterable[str]) -> None:
+    """Drop cached head_object responses for objects that were modified.
+
+    Args:
+        bucket (str): The S3 bucket name
+        keys (Iterable[str]): Keys of the modified objects
+    """
+    global _metadata_cache_generation
+
+    if _metadata_cache is None:
+        return
+
+    modified = set(keys)
+    with _metadata_cache_lock:
+        _metadata_cache_generation += 1
+        stale = [
+            cache_key
+            for cache_key in _metadata_cache
+            if cache_key[0] == "head_object"
+            and cache_key[1] == bucket
+            and cache_key[2] in modified
+        ]
+        for cache_key in stale:
+            _metadata_cache.pop(cache_key, None)
+
+
+def _kwargs(**opts: Any) -> Dict[str, Any]:
+    """Build boto3 request parameters, dropping options that are not set.
+
+    Args:
+        **opts (Any): Request parameters keyed by their boto3 name
+
+    Returns:
+        Dict[str, Any]: Parameters whose value is not None
+    """
+    return {name: value for name, value in opts.items() if value is not None}
+
+
+def _batched(items: List[str], size: int) -> Iterator[List[str]]:
+    """Split a list into consecutive batches.
+
+    Args:
+        items (List[str]): Items to split
+        size (int): Maximum number of items per batch
+
+    Yields:
+        List[str]: The next batch of items
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values orjson cannot serialize natively.
+
+    Args:
+        obj (Any): Value to convert
+
+    Returns:
+        Any: Base64 text for binary data, ``str(obj)`` for anything else
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("ascii")
+    return str(obj)
+
+
+# Serializers with their options bound once, used for every tool response
+_dumps: Final[Callable[[Any], bytes]] = functools.partial(
+    orjson.dumps, default=_json_default, option=JSON_OPTIONS
+)
+_dumps_line: Final[Callable[[Any], bytes]] = functools.partial(
+    orjson.dumps, default=_json_default, option=orjson.OPT_APPEND_NEWLINE
+)
+
+
 def format_response(data: Any) -> str:
     """Format response data as JSON string.
 
@@ -70,7 +336,41 @@ def format_response(data: Any) -> str:
     Returns:
         str: JSON formatted string
     """
-    return json.dumps(data, indent=2, default=str)
+    return _dumps(data).decode("utf-8")
+
+
+def format_lines(items: Iterable[Any]) -> str:
+    """Format items as JSON Lines, one JSON document per line.
+
+    Items are serialized one at a time, so an iterator is never collected
+    into a list first.
+
+    Args:
+        items (Iterable[Any]): Items to format
+
+    Returns:
+        str: JSON Lines formatted string
+    """
+    buffer = io.BytesIO()
+    write = buffer.write
+    for item in items:
+        write(_dumps_line(item))
+    return buffer.getvalue().decode("utf-8")
+
+
+def pack_response(data: Any) -> bytes:
+    """Format response data as MessagePack.
+
+    Binary values are kept as MessagePack bin and datetimes as timestamps,
+    so neither needs a text encoding.
+
+    Args:
+        data (Any): Data to format
+
+    Returns:
+        bytes: MessagePack encoded data
+    """
+    return msgpack.packb(data, use_bin_type=True, datetime=True, default=str)
 
 
 # BUCKET MANAGEMENT
@@ -81,10 +381,9 @@ def _list_buckets_logic() -> Dict[str, Any]:
         Dict[str, Any]: Raw boto3 response from list_buckets.
     """
     client = get_s3_client()
-    return client.list_buckets()
+    return _cached(("list_buckets",), client.list_buckets)
 
 
-@mcp.tool()
 def list_buckets() -> str:
     """Lists all buckets in the AWS account.
 
@@ -100,82 +399,305 @@ def _put_object_logic(
     bucket: str,
     key: str,
     body: Union[str, bytes],
+    *,
+    is_file_path: bool = False,
 ) -> Dict[str, Any]:
     """Core logic to put an object into an S3 bucket.
 
     Args:
         bucket (str): The S3 bucket name.
         key (str): The S3 object key.
-        body (Union[str, bytes]): The content of the object.
+        body (Union[str, bytes]): The content of the object, or a local path
+            when is_file_path is set.
+        is_file_path (bool): Treat body as the path of a file to upload.
 
     Returns:
         Dict[str, Any]: Raw boto3 response from put_object.
+
+    Raises:
+        FileNotFoundError: If is_file_path is set and the file does not exist.
     """
     client = get_s3_client()
     params: Dict[str, Any] = {"Bucket": bucket, "Key": key}
 
-    if isinstance(body, str):
-        params["Body"] = body.encode("utf-8")
+    if is_file_path:
+        # Stream the open file; botocore takes the length from fstat
+        with open(body, "rb") as f:
+            response = client.put_object(Body=f, **params)
     else:
-        params["Body"] = body  # Assuming bytes or file-like object
-
-    return client.put_object(**params)
+        if isinstance(body, str):
+            params["Body"] = body.encode("utf-8")
+            params["ContentType"] = "text/plain; charset=utf-8"
+        else:
+            params["Body"] = body  # Assuming bytes or file-like object
+        response = client.put_object(**params)
+
+    _invalidate_objects(bucket, [key])
+    return response
 
 
-@mcp.tool()
 def put_object(
     bucket: str,
     key: str,
     body: str,
+    is_file_path: bool = False,
 ) -> str:
     """Puts an object into an S3 bucket.
 
     Args:
         bucket (str): The name of the bucket.
         key (str): The key (name) of the object.
-        body (str): The content of the object.
+        body (str): The content of the object, or a local file path when
+            is_file_path is true.
+        is_file_path (bool): Upload the file at the path given in body.
+            Use upload_file for large files to get multipart uploads.
 
     Returns:
         str: JSON formatted S3 response.
     """
-    result = _put_object_logic(bucket=bucket, key=key, body=body)
+    result = _put_object_logic(bucket=bucket, key=key, body=body, is_file_path=is_file_path)
     return format_response(result)
 
 
-def _get_object_logic(bucket: str, key: str) -> Dict[str, Any]:
+def _read_body(
+    body: StreamingBody,
+    content_length: Optional[int] = None,
+) -> Union[bytes, bytearray]:
+    """Read an object body into a single buffer.
+
+    When the content length is known the buffer is allocated up front and
+    filled chunk by chunk, avoiding the intermediate copies of ``read()``.
+
+    Args:
+        body (StreamingBody): The body returned by get_object.
+        content_length (Optional[int]): The ContentLength of the object.
+
+    Returns:
+        Union[bytes, bytearray]: The raw object content.
+    """
+    if content_length is None:
+        return body.read()
+
+    buffer = bytearray(content_length)
+    offset = 0
+    with memoryview(buffer) as view:
+        for chunk in body.iter_chunks(BODY_CHUNK_SIZE):
+            end = offset + len(chunk)
+            view[offset:end] = chunk
+            offset = end
+    return buffer
+
+
+def _byte_range(
+    byte_range: Optional[str] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Optional[str]:
+    """Build the value of an HTTP Range header.
+
+    Args:
+        byte_range (Optional[str]): A complete Range value, used as is.
+        start (Optional[int]): First byte to return, 0 if only end is given.
+        end (Optional[int]): Last byte to return (inclusive), open-ended if None.
+
+    Returns:
+        Optional[str]: Range header value, or None to fetch the whole object.
+    """
+    if byte_range is not None:
+        return byte_range
+    if start is None and end is None:
+        return None
+    return f"bytes={start or 0}-{'' if end is None else end}"
+
+
+def _get_object_logic(
+    bucket: str,
+    key: str,
+    byte_range: Optional[str] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Dict[str, Any]:
     """Core logic to get an object from an S3 bucket.
 
     Args:
         bucket (str): The S3 bucket name.
         key (str): The S3 object key.
+        byte_range (Optional[str]): HTTP Range header, e.g. "bytes=0-4095".
+        start (Optional[int]): First byte to fetch when byte_range is not set.
+        end (Optional[int]): Last byte to fetch (inclusive) when byte_range is not set.
 
     Returns:
-        Dict[str, Any]: Raw boto3 response from get_object.
+        Dict[str, Any]: Raw boto3 response from get_object. Ranged responses
+            include ContentRange with the total object size.
     """
     client = get_s3_client()
-    response = client.get_object(Bucket=bucket, Key=key)
+    params = _kwargs(Bucket=bucket, Key=key, Range=_byte_range(byte_range, start, end))
+    response = client.get_object(**params)
     # The body is a StreamingBody, which is not directly JSON serializable.
-    # We read it and decode it to a string.
-    if 'Body' in response:
-        response['Body'] = response['Body'].read().decode('utf-8')
+    # Text is decoded; binary stays raw bytes, which format_response base64-encodes.
+    body = response.pop('Body', None)
+    if body is not None:
+        data = _read_body(body, response.get('ContentLength'))
+        content_type = response.get('ContentType', '')
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        if content_type.startswith(TEXT_CONTENT_TYPES):
+            response['Body'] = data.decode('utf-8', errors='replace')
+            response['_BodyEncoding'] = 'utf-8'
+        elif media_type in UNTYPED_CONTENT_TYPES:
+            # Untyped objects (e.g. binary/octet-stream) are often still text
+            try:
+                response['Body'] = data.decode('utf-8')
+                response['_BodyEncoding'] = 'utf-8'
+            except UnicodeDecodeError:
+                response['Body'] = data
+                response['_BodyEncoding'] = 'base64'
+        else:
+            response['Body'] = data
+            response['_BodyEncoding'] = 'base64'
     return response
 
 
-@mcp.tool()
-def get_object(bucket: str, key: str) -> str:
-    """Gets an object from an S3 bucket.
+async def get_object(
+    bucket: str,
+    key: str,
+    byte_range: Optional[str] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> str:
+    """Gets an object, or a byte range of it, from an S3 bucket.
 
     Args:
         bucket (str): The name of the bucket.
         key (str): The key (name) of the object.
+        byte_range (Optional[str]): HTTP Range header, e.g. "bytes=0-4095" or
+            "bytes=-1024" for the last 1024 bytes.
+        start (Optional[int]): First byte to fetch when byte_range is not set.
+        end (Optional[int]): Last byte to fetch (inclusive) when byte_range is not set.
 
     Returns:
-        str: JSON formatted S3 response.
+        str: JSON formatted S3 response. Body is plain text for text content
+            types and other UTF-8 content, and base64 for binary content, as
+            indicated by _BodyEncoding. Ranged
+            responses include ContentRange with the total object size.
+    """
+    result = await asyncio.to_thread(
+        _get_object_logic,
+        bucket=bucket,
+        key=key,
+        byte_range=byte_range,
+        start=start,
+        end=end,
+    )
+    return format_response(result)
+
+
+def _select_object_logic(
+    bucket: str,
+    key: str,
+    expression: str,
+    input_serialization: Optional[Dict[str, Any]] = None,
+    output_serialization: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Core logic to run an S3 Select query against an object.
+
+    Args:
+        bucket (str): The S3 bucket name.
+        key (str): The S3 object key.
+        expression (str): The SQL expression to run.
+        input_serialization (Optional[Dict[str, Any]]): Format of the object,
+            JSON Lines by default.
+        output_serialization (Optional[Dict[str, Any]]): Format of the
+            results, JSON by default.
+
+    Returns:
+        Dict[str, Any]: The matching records and the scan statistics.
+    """
+    client = get_s3_client()
+    response = client.select_object_content(
+        Bucket=bucket,
+        Key=key,
+        ExpressionType="SQL",
+        Expression=expression,
+        InputSerialization=input_serialization or {"JSON": {"Type": "LINES"}},
+        OutputSerialization=output_serialization or {"JSON": {}},
+    )
+
+    records = bytearray()
+    stats = None
+    for event in response["Payload"]:
+        if "Records" in event:
+            records += event["Records"]["Payload"]
+        elif "Stats" in event:
+            stats = event["Stats"]["Details"]
+    return {"Records": records.decode("utf-8"), "Stats": stats}
+
+
+async def select_object(
+    bucket: str,
+    key: str,
+    expression: str,
+    input_serialization: Optional[Dict[str, Any]] = None,
+    output_serialization: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Runs an SQL query against a CSV, JSON or Parquet object using S3 Select.
+
+    Only the matching records are transferred, so prefer this over
+    get_object for extracting rows or fields from large objects.
+
+    Args:
+        bucket (str): The name of the bucket.
+        key (str): The key (name) of the object.
+        expression (str): The SQL expression, e.g. "SELECT * FROM s3object s LIMIT 10".
+        input_serialization (Optional[Dict[str, Any]]): S3 InputSerialization,
+            e.g. {"CSV": {"FileHeaderInfo": "USE"}, "CompressionType": "GZIP"}.
+            Defaults to JSON Lines.
+        output_serialization (Optional[Dict[str, Any]]): S3 OutputSerialization.
+            Defaults to JSON.
+
+    Returns:
+        str: JSON formatted records and scan statistics.
     """
-    result = _get_object_logic(bucket=bucket, key=key)
+    result = await asyncio.to_thread(
+        _select_object_logic,
+        bucket=bucket,
+        key=key,
+        expression=expression,
+        input_serialization=input_serialization,
+        output_serialization=output_serialization,
+    )
     return format_response(result)
 
 
+def _read_object_logic(bucket: str, key: str) -> bytes:
+    """Core logic to read the raw content of an object.
+
+    Args:
+        bucket (str): The S3 bucket name.
+        key (str): The S3 object key.
+
+    Returns:
+        bytes: The object content.
+    """
+    client = get_s3_client()
+    response = client.get_object(Bucket=bucket, Key=key)
+    # read() already returns bytes, which FastMCP serves as a binary
+    # resource; a preallocated bytearray would have to be copied again
+    return response['Body'].read()
+
+
+async def read_object(bucket: str, key: str) -> bytes:
+    """Reads the raw content of an object in an S3 bucket.
+
+    Args:
+        bucket (str): The name of the bucket.
+        key (str): The key (name) of the object.
+
+    Returns:
+        bytes: The object content, sent to the client as a binary resource.
+    """
+    return await asyncio.to_thread(_read_object_logic, bucket=bucket, key=key)
+
+
 def _delete_object_logic(bucket: str, key: str) -> Dict[str, Any]:
     """Core logic to delete an object from an S3 bucket.
 
@@ -187,10 +709,11 @@ def _delete_object_logic(bucket: str, key: str) -> Dict[str, Any]:
         Dict[str, Any]: Raw boto3 response from delete_object.
     """
     client = get_s3_client()
-    return client.delete_object(Bucket=bucket, Key=key)
+    response = client.delete_object(Bucket=bucket, Key=key)
+    _invalidate_objects(bucket, [key])
+    return response
 
 
-@mcp.tool()
 def delete_object(bucket: str, key: str) -> str:
     """Deletes an object from an S3 bucket.
 
@@ -225,20 +748,17 @@ def _list_objects_v2_logic(
         Dict[str, Any]: Raw boto3 response from list_objects_v2.
     """
     client = get_s3_client()
-    params: Dict[str, Any] = {"Bucket": bucket}
-    if prefix:
-        params["Prefix"] = prefix
-    if max_keys:
-        params["MaxKeys"] = max_keys
-    if continuation_token:
-        params["ContinuationToken"] = continuation_token
-    if delimiter:
-        params["Delimiter"] = delimiter
+    params = _kwargs(
+        Bucket=bucket,
+        Prefix=prefix,
+        MaxKeys=max_keys,
+        ContinuationToken=continuation_token,
+        Delimiter=delimiter,
+    )
     return client.list_objects_v2(**params)
 
 
-@mcp.tool()
-def list_objects_v2(
+async def list_objects_v2(
     bucket: str,
     prefix: Optional[str] = None,
     max_keys: Optional[int] = None,
@@ -257,7 +777,8 @@ def list_objects_v2(
     Returns:
         str: JSON formatted S3 response.
     """
-    result = _list_objects_v2_logic(
+    result = await asyncio.to_thread(
+        _list_objects_v2_logic,
         bucket=bucket,
         prefix=prefix,
         max_keys=max_keys,
@@ -267,6 +788,132 @@ def list_objects_v2(
     return format_response(result)
 
 
+def _iter_objects_logic(
+    bucket: str,
+    prefix: Optional[str] = None,
+    page_size: int = 1000,
+) -> Iterator[Dict[str, Any]]:
+    """Core logic to iterate over all objects in an S3 bucket.
+
+    Args:
+        bucket (str): The S3 bucket name.
+        prefix (Optional[str]): Filter for keys starting with this prefix.
+        page_size (int): Number of keys requested per list_objects_v2 call.
+
+    Yields:
+        Dict[str, Any]: Key, Size and ETag of each object.
+    """
+    client = get_s3_client()
+    paginator = client.get_paginator("list_objects_v2")
+    params = _kwargs(
+        Bucket=bucket,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": page_size},
+    )
+    pages = paginator.paginate(**params)
+    for item in pages.search("Contents[].{Key: Key, Size: Size, ETag: ETag}"):
+        # Pages without any Contents yield None
+        if item is not None:
+            yield item
+
+
+def _iter_all_objects_logic(
+    bucket: str,
+    prefix: Optional[str] = None,
+    delimiter: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Core logic to iterate over all objects in an S3 bucket.
+
+    Without a delimiter the bucket is walked page by page and objects are
+    yielded as each page arrives. With a delimiter, the common prefixes
+    directly below ``prefix`` are listed first and then walked concurrently.
+    Each prefix is listed in full on a worker before its objects are
+    yielded, and at most ``EXECUTOR_MAX_WORKERS`` prefix listings are held
+    in memory at a time.
+
+    Args:
+        bucket (str): The S3 bucket name.
+        prefix (Optional[str]): Filter for keys starting with this prefix.
+        delimiter (Optional[str]): Delimiter used to split the listing.
+
+    Yields:
+        Dict[str, Any]: Key, Size and ETag of each object, grouped by
+            common prefix.
+    """
+    if delimiter is None:
+        yield from _iter_objects_logic(bucket=bucket, prefix=prefix)
+        return
+
+    client = get_s3_client()
+    paginator = client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(**_kwargs(Bucket=bucket, Prefix=prefix, Delimiter=delimiter))
+
+    common_prefixes: List[str] = []
+    for page in pages:
+        common_prefixes.extend(common["Prefix"] for common in page.get("CommonPrefixes", []))
+        for obj in page.get("Contents", []):
+            yield {"Key": obj["Key"], "Size": obj["Size"], "ETag": obj["ETag"]}
+
+    def submit(common_prefix: str) -> Future:
+        # The generator body, and so every request, runs in the worker
+        return _executor.submit(list, _iter_objects_logic(bucket=bucket, prefix=common_prefix))
+
+    # Keep a bounded window of prefixes in flight, in listing order
+    remaining = iter(common_prefixes)
+    pending = deque(submit(p) for p in islice(remaining, EXECUTOR_MAX_WORKERS))
+    done = 0
+    while pending:
+        listing = pending.popleft().result()
+        next_prefix = next(remaining, None)
+        if next_prefix is not None:
+            pending.append(submit(next_prefix))
+        done += 1
+        logger.info("Finished listing prefix %d/%d", done, len(common_prefixes))
+        yield from listing
+
+
+async def list_all_objects(
+    bucket: str,
+    prefix: Optional[str] = None,
+    delimiter: Optional[str] = None,
+) -> str:
+    """Lists all objects in an S3 bucket, following pagination.
+
+    Args:
+        bucket (str): The name of the bucket.
+        prefix (Optional[str]): Filter for keys starting with this prefix.
+        delimiter (Optional[str]): List each common prefix concurrently,
+            e.g. "/" to fan out over top-level folders. Each prefix's
+            listing is buffered in full before it is written out.
+
+    Returns:
+        str: JSON Lines with the key, size and ETag of one object per line.
+    """
+    # The generator issues its requests while being consumed, so format in the thread
+    return await asyncio.to_thread(
+        format_lines,
+        _iter_all_objects_logic(bucket=bucket, prefix=prefix, delimiter=delimiter),
+    )
+
+
+async def read_object_listing(bucket: str, prefix: Optional[str] = None) -> bytes:
+    """Lists all objects in an S3 bucket as MessagePack.
+
+    Args:
+        bucket (str): The name of the bucket.
+        prefix (Optional[str]): Filter for keys starting with this prefix.
+
+    Returns:
+        bytes: MessagePack encoded list of object keys, sizes and ETags.
+    """
+    contents = await asyncio.to_thread(
+        list, _iter_all_objects_logic(bucket=bucket, prefix=prefix)
+    )
+    return pack_response(
+        {"Bucket": bucket, "Prefix": prefix, "KeyCount": len(contents), "Contents": contents}
+    )
+
+
 def _head_object_logic(
     bucket: str,
     key: str,
@@ -287,18 +934,25 @@ def _head_object_logic(
         Dict[str, Any]: Raw boto3 response from head_object.
     """
     client = get_s3_client()
-    params: Dict[str, Any] = {"Bucket": bucket, "Key": key}
-    if if_match:
-        params["IfMatch"] = if_match
-    if if_none_match:
-        params["IfNoneMatch"] = if_none_match
-    if version_id:
-        params["VersionId"] = version_id
-    return client.head_object(**params)
+    params = _kwargs(
+        Bucket=bucket,
+        Key=key,
+        IfMatch=if_match,
+        IfNoneMatch=if_none_match,
+        VersionId=version_id,
+    )
+    return _cached(
+        ("head_object", bucket, key, version_id, if_match, if_none_match),
+        lambda: client.head_object(**params),
+    )
+
 
+# Fixed head_object responses for failed conditional requests
+_NOT_MODIFIED: Final[str] = format_response({"status": "not_modified"})
+_PRECONDITION_FAILED: Final[str] = format_response({"status": "precondition_failed"})
 
-@mcp.tool()
-def head_object(
+
+async def head_object(
     bucket: str,
     key: str,
     if_match: Optional[str] = None,
@@ -315,15 +969,25 @@ def head_object(
         version_id (Optional[str]): Version of the object.
 
     Returns:
-        str: JSON formatted S3 response.
+        str: JSON formatted S3 response, or a status of "not_modified" or
+            "precondition_failed" when a condition is not met.
     """
-    result = _head_object_logic(
-        bucket=bucket,
-        key=key,
-        if_match=if_match,
-        if_none_match=if_none_match,
-        version_id=version_id,
-    )
+    try:
+        result = await asyncio.to_thread(
+            _head_object_logic,
+            bucket=bucket,
+            key=key,
+            if_match=if_match,
+            if_none_match=if_none_match,
+            version_id=version_id,
+        )
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code")
+        if code == "304":
+            return _NOT_MODIFIED
+        if code in ("412", "PreconditionFailed"):
+            return _PRECONDITION_FAILED
+        raise
     return format_response(result)
 
 
@@ -341,16 +1005,11 @@ def _upload_file_logic(
         key (str): The S3 object key.
         extra_args (Optional[Dict[str, Any]]): Extra arguments for the upload.
     """
-    client = get_s3_client()
-    client.upload_file(
-        Filename=filename,
-        Bucket=bucket,
-        Key=key,
-        ExtraArgs=extra_args,
-    )
+    manager = get_transfer_manager()
+    manager.upload(filename, bucket, key, extra_args=extra_args).result()
+    _invalidate_objects(bucket, [key])
 
 
-@mcp.tool()
 def upload_file(
     filename: str,
     bucket: str,
@@ -384,15 +1043,10 @@ def _download_file_logic(
         key (str): The S3 object key.
         filename (str): The local path to download the file to.
     """
-    client = get_s3_client()
-    client.download_file(
-        Bucket=bucket,
-        Key=key,
-        Filename=filename,
-    )
+    manager = get_transfer_manager()
+    manager.download(bucket, key, filename).result()
 
 
-@mcp.tool()
 def download_file(
     bucket: str,
     key: str,
@@ -433,14 +1087,15 @@ def _copy_object_logic(
     """
     client = get_s3_client()
     copy_source = {'Bucket': source_bucket, 'Key': source_key}
-    return client.copy_object(
+    response = client.copy_object(
         CopySource=copy_source,
         Bucket=destination_bucket,
         Key=destination_key,
     )
+    _invalidate_objects(destination_bucket, [destination_key])
+    return response
 
 
-@mcp.tool()
 def copy_object(
     source_bucket: str,
     source_key: str,
@@ -474,24 +1129,48 @@ def _delete_objects_logic(
 ) -> Dict[str, Any]:
     """Core logic to delete multiple objects from an S3 bucket.
 
+    Keys are sent in batches of up to 1000, the DeleteObjects limit. When
+    there is more than one batch, the batches are issued concurrently.
+
     Args:
         bucket (str): The S3 bucket name.
         keys (List[str]): A list of keys to delete.
         quiet (bool): Whether to suppress errors and return only failed deletions.
 
     Returns:
-        Dict[str, Any]: Raw boto3 response from delete_objects.
+        Dict[str, Any]: Deleted and Errors lists merged from all batches.
     """
     client = get_s3_client()
-    objects_to_delete = [{'Key': key} for key in keys]
-    delete_payload = {'Objects': objects_to_delete, 'Quiet': quiet}
-    return client.delete_objects(
-        Bucket=bucket,
-        Delete=delete_payload,
-    )
+
+    def delete_batch(batch: List[str]) -> Dict[str, Any]:
+        return client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': quiet},
+        )
+
+    batches = list(_batched(keys, DELETE_BATCH_SIZE))
+    futures: List[Future] = []
+    if len(batches) <= 1:
+        # A single request gains nothing from a hop to a worker thread
+        responses: Iterable[Dict[str, Any]] = map(delete_batch, batches)
+    else:
+        futures = [_executor.submit(delete_batch, batch) for batch in batches]
+        responses = (future.result() for future in as_completed(futures))
+
+    result: Dict[str, Any] = {'Deleted': [], 'Errors': []}
+    try:
+        for done, response in enumerate(responses, start=1):
+            result['Deleted'].extend(response.get('Deleted', []))
+            result['Errors'].extend(response.get('Errors', []))
+            logger.info("Finished delete batch %d/%d", done, len(batches))
+    finally:
+        # Other batches may have deleted keys even if one failed; let any
+        # still in flight finish before dropping their cache entries.
+        wait(futures)
+        _invalidate_objects(bucket, keys)
+    return result
 
 
-@mcp.tool()
 def delete_objects(
     bucket: str,
     keys: List[str],
@@ -515,18 +1194,65 @@ def delete_objects(
     return format_response(result)
 
 
+# URI template of the resource serving raw object content
+OBJECT_RESOURCE_URI: Final[str] = "s3://{bucket}/{key*}"
+
+# URI templates of the MessagePack listing resources, with and without prefix
+LISTING_RESOURCE_URI: Final[str] = "s3-listing://{bucket}"
+PREFIX_LISTING_RESOURCE_URI: Final[str] = "s3-listing://{bucket}/{prefix*}"
+
+# Tools exposed by the MCP server, registered in create_server()
+_TOOLS: Final[List[Callable[..., Any]]] = [
+    list_buckets,
+    put_object,
+    get_object,
+    select_object,
+    delete_object,
+    list_objects_v2,
+    list_all_objects,
+    head_object,
+    upload_file,
+    download_file,
+    copy_object,
+    delete_objects,
+]
+
+
+def create_server() -> "FastMCP":
+    """Create the FastMCP server and register all tools and resources.
+
+    Tool schemas are generated here rather than at import time, so importing
+    this module for its logic functions stays cheap.
+
+    Returns:
+        FastMCP: Server with all S3 tools and resources registered
+    """
+    from fastmcp import FastMCP
+
+    mcp = FastMCP("S3 MCP Server")
+    for tool in _TOOLS:
+        mcp.tool()(tool)
+    mcp.resource(OBJECT_RESOURCE_URI, mime_type="application/octet-stream")(read_object)
+    if msgpack is not None:
+        for name, uri in (
+            ("list_objects_msgpack", LISTING_RESOURCE_URI),
+            ("list_prefix_objects_msgpack", PREFIX_LISTING_RESOURCE_URI),
+        ):
+            mcp.resource(uri, name=name, mime_type="application/msgpack")(read_object_listing)
+    return mcp
+
+
 def main() -> None:
     """Main entry point for execution."""
     logger.info("Starting S3 MCP Server")
-    aws_region = os.getenv("AWS_DEFAULT_REGION", "Not specified (using default)")
-    logger.info(f"AWS Region: {aws_region}")
+    logger.info("AWS Region: %s", AWS_REGION or "Not specified (using default)")
 
     try:
-        mcp.run()
+        create_server().run()
     except KeyboardInterrupt:
         logger.info("Server stopped by user.")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e, exc_info=DEBUG)
         raise
 
 